@@ -204,7 +204,7 @@ Parameters
 
         """
 
-        ax = ax or plt.gca()
+        ax = plt.gca() if ax is None else ax
 
         if type(imgs) is not list:
             imgs = [imgs]
@@ -665,7 +665,7 @@ class PersistenceImager(TransformerMixin):
         pmin -= p_plot_buff
         pmax += p_plot_buff
 
-        ax = ax or plt.gca()
+        ax = plt.gca() if ax is None else ax
         ax.set_xlim(bmin, bmax)
         ax.set_ylim(pmin, pmax)
 
@@ -719,7 +719,7 @@ class PersistenceImager(TransformerMixin):
         matplotlib.Axes
             The matplotlib.Axes which contains the persistence image
         """
-        ax = ax or plt.gca()
+        ax = plt.gca() if ax is None else ax
         ax.matshow(pers_img.T, **{'origin': 'lower'})
 
         # fix and label axes
@@ -171,7 +171,7 @@ def plot_landscape_exact_simple(
         transparency of shading
 
     """
-    ax = ax or plt.gca()
+    ax = plt.gca() if ax is None else ax
     landscape.compute_landscape()
     crit_pairs = list(itertools.chain.from_iterable(landscape.critical_pairs))
     min_crit_pt = min(crit_pairs, key=itemgetter(0))[0]  # smallest birth time
@@ -298,7 +298,7 @@ def plot_landscape_approx_simple(
         number of sampled points that are plotted
 
     """
-    ax = ax or plt.gca()
+    ax = plt.gca() if ax is None else ax
 
     landscape.compute_landscape()
 
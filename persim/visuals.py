@@ -1,8 +1,32 @@
 import numpy as np
 import matplotlib.pyplot as plt
+from matplotlib.collections import LineCollection
 
 __all__ = ["plot_diagrams", "bottleneck_matching", "wasserstein_matching"]
 
+# cos(pi/4) == sin(pi/4), used to project points onto the diagonal
+_SQRT2_OVER_2 = np.float64(2 ** -0.5)
+
+
+def _rotate45(A):
+    """Rotate the rows of A by pi/4, so the diagonal becomes the x axis."""
+    s0 = (A[:, 0] + A[:, 1]) * _SQRT2_OVER_2
+    s1 = (A[:, 1] - A[:, 0]) * _SQRT2_OVER_2
+    return np.column_stack([s0, s1])
+
+
+def _unrotate45(A):
+    """Inverse of _rotate45."""
+    s0 = (A[:, 0] - A[:, 1]) * _SQRT2_OVER_2
+    s1 = (A[:, 0] + A[:, 1]) * _SQRT2_OVER_2
+    return np.column_stack([s0, s1])
+
+
+def _diagonal_projection(A):
+    """Closest points on the diagonal to the rows of A."""
+    rot = _rotate45(A)
+    return _unrotate45(np.column_stack([rot[:, 0], np.zeros(len(rot))]))
+
 
 def plot_diagrams(
     diagrams,
@@ -62,7 +86,7 @@ def plot_diagrams(
         of a subplot, set show=False and call plt.show() only once at the end.
     """
 
-    ax = ax or plt.gca()
+    ax = plt.gca() if ax is None else ax
     plt.style.use(colormap)
 
     xlabel, ylabel = "Birth", "Death"
@@ -82,19 +106,26 @@ def plot_diagrams(
     if not isinstance(labels, list):
         labels = [labels] * len(diagrams)
 
-    # Construct copy with proper type of each diagram
-    # so we can freely edit them.
-    diagrams = [dgm.astype(np.float32, copy=True) for dgm in diagrams]
-
     # find min and max of all visible diagrams
-    concat_dgms = np.concatenate(diagrams).flatten()
-    has_inf = np.any(np.isinf(concat_dgms))
-    finite_dgms = concat_dgms[np.isfinite(concat_dgms)]
+    has_inf = False
+    ax_min, ax_max = np.inf, -np.inf
+    for dgm in diagrams:
+        has_inf = has_inf or bool(np.isinf(dgm).any())
+        finite = dgm[np.isfinite(dgm)]
+        if finite.size:
+            ax_min = min(ax_min, float(finite.min()))
+            ax_max = max(ax_max, float(finite.max()))
+
+    # Only copy the diagrams if we are going to edit them below,
+    # otherwise a view with the proper type is enough.
+    if lifetime or has_inf:
+        diagrams = [np.array(dgm, dtype=np.float32) for dgm in diagrams]
+    else:
+        diagrams = [np.ascontiguousarray(dgm, dtype=np.float32) for dgm in diagrams]
 
     # clever bounding boxes of the diagram
     if not xy_range:
         # define bounds of diagram
-        ax_min, ax_max = np.min(finite_dgms), np.max(finite_dgms)
         x_r = ax_max - ax_min
 
         # Give plot a nice buffer on all sides.
@@ -141,13 +172,24 @@ def plot_diagrams(
 
         # convert each inf in each diagram with b_inf
         for dgm in diagrams:
-            dgm[np.isinf(dgm)] = b_inf
+            np.copyto(dgm, b_inf, where=np.isinf(dgm))
 
     # Plot each diagram
-    for dgm, label in zip(diagrams, labels):
-
-        # plot persistence pairs
-        ax.scatter(dgm[:, 0], dgm[:, 1], size, label=label, edgecolor="none")
+    colors = plt.rcParams["axes.prop_cycle"].by_key()["color"]
+    for k, (dgm, label) in enumerate(zip(diagrams, labels)):
+
+        # plot persistence pairs beneath the diagonal and infinity lines
+        ax.plot(
+            dgm[:, 0],
+            dgm[:, 1],
+            marker="o",
+            linestyle="none",
+            markersize=np.sqrt(size),
+            markeredgewidth=0,
+            color=colors[k % len(colors)],
+            zorder=1,
+            label=label,
+        )
 
         ax.set_xlabel(xlabel)
         ax.set_ylabel(ylabel)
@@ -196,22 +238,27 @@ def bottleneck_matching(dgm1, dgm2, matching, labels=["dgm1", "dgm2"], ax=None):
     persim.bottleneck_matching(A_h1, B_h1, matching)
 
     """
-    ax = ax or plt.gca()
+    matching = np.asarray(matching).reshape(-1, 3)
+    if dgm1.size == 0 and dgm2.size == 0 and len(matching) == 0:
+        # Nothing to draw
+        return
+
+    ax = plt.gca() if ax is None else ax
 
     plot_diagrams([dgm1, dgm2], labels=labels, ax=ax)
-    cp = np.cos(np.pi / 4)
-    sp = np.sin(np.pi / 4)
-    R = np.array([[cp, -sp], [sp, cp]])
     if dgm1.size == 0:
         dgm1 = np.array([[0, 0]])
     if dgm2.size == 0:
         dgm2 = np.array([[0, 0]])
-    dgm1Rot = dgm1.dot(R)
-    dgm2Rot = dgm2.dot(R)
-    max_idx = np.argmax(matching[:, 2])
-    for idx, [i, j, d] in enumerate(matching):
-        i = int(i)
-        j = int(j)
+    dgm1Diag = _diagonal_projection(dgm1)
+    dgm2Diag = _diagonal_projection(dgm2)
+
+    matchidx = matching[:, 0:2].astype(np.intp)
+    max_idx = np.argmax(matching[:, 2]) if len(matching) else -1
+    # At least one point is a non-diagonal point
+    drawn = np.flatnonzero((matchidx[:, 0] != -1) | (matchidx[:, 1] != -1))
+    for idx in drawn:
+        i, j = matchidx[idx]
         linestyle = '--'
         linewidth = 1
         c = 'C2'
@@ -219,17 +266,12 @@ def bottleneck_matching(dgm1, dgm2, matching, labels=["dgm1", "dgm2"], ax=None):
             linestyle = '-'
             linewidth = 2
             c = 'C3'
-        if i != -1 or j != -1: # At least one point is a non-diagonal point
-            if i == -1:
-                diagElem = np.array([dgm2Rot[j, 0], 0])
-                diagElem = diagElem.dot(R.T)
-                plt.plot([dgm2[j, 0], diagElem[0]], [dgm2[j, 1], diagElem[1]], c, linewidth=linewidth, linestyle=linestyle)
-            elif j == -1:
-                diagElem = np.array([dgm1Rot[i, 0], 0])
-                diagElem = diagElem.dot(R.T)
-                ax.plot([dgm1[i, 0], diagElem[0]], [dgm1[i, 1], diagElem[1]], c, linewidth=linewidth, linestyle=linestyle)
-            else:
-                ax.plot([dgm1[i, 0], dgm2[j, 0]], [dgm1[i, 1], dgm2[j, 1]], c, linewidth=linewidth, linestyle=linestyle)
+        if i == -1:
+            ax.plot([dgm2[j, 0], dgm2Diag[j, 0]], [dgm2[j, 1], dgm2Diag[j, 1]], c, linewidth=linewidth, linestyle=linestyle)
+        elif j == -1:
+            ax.plot([dgm1[i, 0], dgm1Diag[i, 0]], [dgm1[i, 1], dgm1Diag[i, 1]], c, linewidth=linewidth, linestyle=linestyle)
+        else:
+            ax.plot([dgm1[i, 0], dgm2[j, 0]], [dgm1[i, 1], dgm2[j, 1]], c, linewidth=linewidth, linestyle=linestyle)
 
 
 def wasserstein_matching(dgm1, dgm2, matching, labels=["dgm1", "dgm2"], ax=None):
@@ -259,30 +301,25 @@ def wasserstein_matching(dgm1, dgm2, matching, labels=["dgm1", "dgm2"], ax=None)
     persim.wasserstein_matching(A_h1, B_h1, matchidx, D)
 
     """
-    ax = ax or plt.gca()
+    ax = plt.gca() if ax is None else ax
 
-    cp = np.cos(np.pi / 4)
-    sp = np.sin(np.pi / 4)
-    R = np.array([[cp, -sp], [sp, cp]])
     if dgm1.size == 0:
         dgm1 = np.array([[0, 0]])
     if dgm2.size == 0:
         dgm2 = np.array([[0, 0]])
-    dgm1Rot = dgm1.dot(R)
-    dgm2Rot = dgm2.dot(R)
-    for [i, j, d] in matching:
-        i = int(i)
-        j = int(j)
-        if i != -1 or j != -1: # At least one point is a non-diagonal point
-            if i == -1:
-                diagElem = np.array([dgm2Rot[j, 0], 0])
-                diagElem = diagElem.dot(R.T)
-                plt.plot([dgm2[j, 0], diagElem[0]], [dgm2[j, 1], diagElem[1]], "g")
-            elif j == -1:
-                diagElem = np.array([dgm1Rot[i, 0], 0])
-                diagElem = diagElem.dot(R.T)
-                ax.plot([dgm1[i, 0], diagElem[0]], [dgm1[i, 1], diagElem[1]], "g")
-            else:
-                ax.plot([dgm1[i, 0], dgm2[j, 0]], [dgm1[i, 1], dgm2[j, 1]], "g")
+    matching = np.asarray(matching).reshape(-1, 3)
+    matchidx = matching[:, 0:2].astype(np.intp)
+    i, j = matchidx[:, 0], matchidx[:, 1]
+    both = (i != -1) & (j != -1)
+    # Points matched to the diagonal, from dgm2 and dgm1 respectively
+    diag2 = (i == -1) & (j != -1)
+    diag1 = (i != -1) & (j == -1)
+
+    proj2 = _diagonal_projection(dgm2[j[diag2]])
+    proj1 = _diagonal_projection(dgm1[i[diag1]])
+
+    starts = np.concatenate([dgm1[i[both]], dgm2[j[diag2]], dgm1[i[diag1]]])
+    ends = np.concatenate([dgm2[j[both]], proj2, proj1])
+    ax.add_collection(LineCollection(np.stack([starts, ends], axis=1), colors="g"))
 
     plot_diagrams([dgm1, dgm2], labels=labels, ax=ax)
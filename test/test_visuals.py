@@ -2,9 +2,11 @@ import pytest
 import numpy as np
 
 import matplotlib.pyplot as plt
+import matplotlib.colors as mcolors
 
 import persim
 from persim import plot_diagrams
+from persim.visuals import _diagonal_projection, _rotate45, _unrotate45
 
 
 """
@@ -27,7 +29,8 @@ from persim import plot_diagrams
     -----
 
     ax.get_children() gives all the pieces in the plot, very useful
-    Scatter data is of type `PathCollection` and will be a child of ax.
+    Diagram points are drawn as marker-only `Line2D` objects, added to ax.lines
+    after the diagonal and infinity lines.
 
 """
 
@@ -46,10 +49,9 @@ class TestPlotting:
         assert x_plot[0] <= np.min(diagram)
         assert x_plot[1] >= np.max(diagram)
 
-        # get PathCollection
-        pathcols = [child for child in ax.get_children()
-                    if child.__class__.__name__ == "PathCollection"]
-        assert len(pathcols) == 1
+        # diagonal followed by the diagram points
+        assert len(ax.lines) == 2
+        np.testing.assert_array_equal(ax.lines[1].get_xydata(), diagram)
 
     def test_multiple(self):
         diagrams = [
@@ -60,12 +62,33 @@ class TestPlotting:
         f, ax = plt.subplots()
         plot_diagrams(diagrams, show=False)
 
-        pathcols = [child for child in ax.get_children()
-                    if child.__class__.__name__ == "PathCollection"]
+        points = ax.lines[1:]
 
-        assert len(pathcols) == 2
-        np.testing.assert_array_equal(pathcols[0].get_offsets(), diagrams[0])
-        np.testing.assert_array_equal(pathcols[1].get_offsets(), diagrams[1])
+        assert len(points) == 2
+        np.testing.assert_array_equal(points[0].get_xydata(), diagrams[0])
+        np.testing.assert_array_equal(points[1].get_xydata(), diagrams[1])
+
+    def test_point_colors(self):
+        diagrams = [
+            np.array([[0, 1], [1, 1], [2, 4], [3, 5]]),
+            np.array([[0.5, 3], [2, 4], [4, 5], [10, 15]])
+        ]
+
+        f, ax = plt.subplots()
+        plot_diagrams(diagrams, show=False, ax=ax)
+
+        points = ax.lines[-2:]
+        assert [mcolors.to_hex(p.get_color()) for p in points] == ["#1f77b4", "#ff7f0e"]
+        assert all(p.get_zorder() == 1 for p in points)
+
+    def test_colormap_reapplied(self):
+        diagram = np.array([[0, 1], [1, 1], [2, 4], [3, 5]])
+
+        plot_diagrams(diagram, show=False)
+        plt.style.use("ggplot")
+        plot_diagrams(diagram, show=False)
+
+        assert mcolors.to_hex(plt.rcParams["axes.facecolor"]) == "#ffffff"
 
     def test_plot_only(self):
         diagrams = [
@@ -75,6 +98,17 @@ class TestPlotting:
         f, ax = plt.subplots()
         plot_diagrams(diagrams, legend=False, show=False, plot_only=[1])
 
+    def test_plot_only_labels(self):
+        diagrams = [
+            np.array([[0, 1], [1, 1], [2, 4], [3, 5]]),
+            np.array([[0.5, 3], [2, 4], [4, 5], [10, 15]])
+        ]
+        f, ax = plt.subplots()
+        plot_diagrams(diagrams, show=False, plot_only=[1])
+
+        texts = [t.get_text() for t in ax.get_legend().get_texts()]
+        assert texts == ["$H_{1}$"]
+
     def test_legend_true(self):
         diagrams = [
             np.array([[0, 1], [1, 1], [2, 4], [3, 5]]),
@@ -164,16 +198,15 @@ class TestPlotting:
         f, ax = plt.subplots()
         plot_diagrams(diagrams, lifetime=True, show=False)
 
-        pathcols = [child for child in ax.get_children()
-                    if child.__class__.__name__ == "PathCollection"]
+        points = ax.lines[1:]
 
         modded1 = diagrams[0]
         modded1[:, 1] = diagrams[0][:, 1] - diagrams[0][:, 0]
         modded2 = diagrams[1]
         modded2[:, 1] = diagrams[1][:, 1] - diagrams[1][:, 0]
-        assert len(pathcols) == 2
-        np.testing.assert_array_equal(pathcols[0].get_offsets(), modded1)
-        np.testing.assert_array_equal(pathcols[1].get_offsets(), modded2)
+        assert len(points) == 2
+        np.testing.assert_array_equal(points[0].get_xydata(), modded1)
+        np.testing.assert_array_equal(points[1].get_xydata(), modded2)
 
     def test_infty(self):
         diagrams = [
@@ -186,6 +219,19 @@ class TestPlotting:
 
         # Right now just make sure nothing breaks
 
+    def test_inputs_not_modified(self):
+        diagrams = [
+            np.array([[0, np.inf], [1, 1], [2, 4], [3, 5]]),
+            np.array([[0.5, 3], [2, 4], [4, 5], [10, 15]])
+        ]
+        originals = [dgm.copy() for dgm in diagrams]
+
+        f, ax = plt.subplots()
+        plot_diagrams(diagrams, lifetime=True, show=False)
+
+        for dgm, original in zip(diagrams, originals):
+            np.testing.assert_array_equal(dgm, original)
+
 
 class TestMatching:
     def test_bottleneck_matching(self):
@@ -214,3 +260,93 @@ class TestMatching:
         d, matching = persim.bottleneck(dgm1, dgm2, matching=True)
         persim.bottleneck_matching(
             dgm1, dgm2, matching, labels=["X", "Y"])
+
+    def test_wasserstein_matching(self):
+        dgm1 = np.array([
+            [0.1, 0.2],
+            [0.2, 0.4]
+        ])
+        dgm2 = np.array([
+            [0.1, 0.2],
+            [0.3, 0.45],
+            [0.5, 0.9]
+        ])
+
+        d, matching = persim.wasserstein(dgm1, dgm2, matching=True)
+
+        f, ax = plt.subplots()
+        persim.wasserstein_matching(dgm1, dgm2, matching, ax=ax)
+
+        linecols = [child for child in ax.get_children()
+                    if child.__class__.__name__ == "LineCollection"]
+        assert len(linecols) == 1
+        assert len(linecols[0].get_segments()) == len(matching)
+
+    def test_empty_list_matching(self):
+        dgm1 = np.array([[0.1, 0.2]])
+        dgm2 = np.array([[0.3, 0.45]])
+
+        f, ax = plt.subplots()
+        persim.bottleneck_matching(dgm1, dgm2, [], ax=ax)
+        persim.wasserstein_matching(dgm1, dgm2, [], ax=ax)
+
+        linecols = [child for child in ax.get_children()
+                    if child.__class__.__name__ == "LineCollection"]
+        assert len(linecols) == 1
+        assert len(linecols[0].get_segments()) == 0
+
+    def test_bottleneck_matching_empty_diagrams(self):
+        dgm = np.zeros((0, 2))
+
+        f, ax = plt.subplots()
+        persim.bottleneck_matching(dgm, dgm, [], ax=ax)
+
+        assert len(ax.lines) == 0
+
+    def test_wasserstein_matching_empty_diagrams(self):
+        dgm = np.zeros((0, 2))
+
+        d, matching = persim.wasserstein(dgm, dgm, matching=True)
+
+        f, ax = plt.subplots()
+        persim.wasserstein_matching(dgm, dgm, matching, ax=ax)
+
+
+class TestDiagonalProjection:
+    def test_projection(self):
+        np.testing.assert_allclose(
+            _diagonal_projection(np.array([[1.0, 3.0]])), [[2.0, 2.0]])
+
+    def test_rotation_roundtrip(self):
+        A = np.array([[0.0, 1.0], [1.0, 3.0], [2.5, 2.5]])
+        np.testing.assert_allclose(_unrotate45(_rotate45(A)), A)
+        # the diagonal lands on the x axis
+        np.testing.assert_allclose(_rotate45(A)[2, 1], 0, atol=1e-12)
+
+    def _diagonal_matching(self):
+        dgm1 = np.array([[1.0, 3.0]])
+        dgm2 = np.array([[0.5, 4.5]])
+        matching = np.array([[0, -1, 1.0], [-1, 0, 2.0]])
+        return dgm1, dgm2, matching
+
+    def test_bottleneck_endpoints(self):
+        dgm1, dgm2, matching = self._diagonal_matching()
+
+        f, ax = plt.subplots()
+        persim.bottleneck_matching(dgm1, dgm2, matching, ax=ax)
+
+        # diagonal and two diagrams come first
+        segments = [line.get_xydata() for line in ax.lines[3:]]
+        np.testing.assert_allclose(segments[0], [[1.0, 3.0], [2.0, 2.0]])
+        np.testing.assert_allclose(segments[1], [[0.5, 4.5], [2.5, 2.5]])
+
+    def test_wasserstein_endpoints(self):
+        dgm1, dgm2, matching = self._diagonal_matching()
+
+        f, ax = plt.subplots()
+        persim.wasserstein_matching(dgm1, dgm2, matching, ax=ax)
+
+        segments = sorted(
+            ax.collections[0].get_segments(), key=lambda seg: seg[0, 0])
+        np.testing.assert_allclose(segments[0], [[0.5, 4.5], [2.5, 2.5]])
+        np.testing.assert_allclose(segments[1], [[1.0, 3.0], [2.0, 2.0]])